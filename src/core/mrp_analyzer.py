@@ -10,12 +10,16 @@ Date: August 2025
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import io
 import os
+import shutil
 import logging
+import importlib.util
 from pathlib import Path
-from typing import Tuple, Optional, Dict, Any, List
+from typing import Tuple, Optional, Dict, Any, List, FrozenSet
 from functools import lru_cache
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from openpyxl import load_workbook
 
 # Configure detailed logging
 logging.basicConfig(
@@ -29,22 +33,36 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Rust-based calamine parser (pandas >= 2.2) reads xlsx/xls much faster than openpyxl
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+EXCEL_READ_ENGINE = (
+    'calamine'
+    if _PANDAS_VERSION >= (2, 2) and importlib.util.find_spec('python_calamine')
+    else None
+)
+
+@dataclass(frozen=True)
 class MRPConfig:
     """Configuration settings for MRP analysis."""
-    REQUIRED_COLUMNS: List[str] = (
+    REQUIRED_COLUMNS: Tuple[str, ...] = (
         "CÓD", "DESCRIÇÃOPROMOB", "ESTQ10", "ESTQ20", "DEMANDAMRP",
         "ESTOQSEG", "FORNECEDORPRINCIPAL", "PEDIDOS", "OBS"
     )
-    NUMERIC_COLUMNS: List[str] = (
+    NUMERIC_COLUMNS: Tuple[str, ...] = (
         "ESTQ10", "ESTQ20", "DEMANDAMRP", "ESTOQSEG", "PEDIDOS"
     )
-    OUTPUT_COLUMNS: List[str] = (
+    OUTPUT_COLUMNS: Tuple[str, ...] = (
         "CÓD", "FORNECEDOR PRINCIPAL", "DESCRIÇÃOPROMOB", "ESTQ10", "ESTQ20",
         "DEMANDAMRP", "ESTOQSEG", "PEDIDOS", "ESTOQUE DISPONÍVEL",
         "QUANTIDADE A SOLICITAR", "OBS"
     )
     HISTORY_DIR: str = "historico_mrp"
+    HISTORY_FORMAT: str = "parquet"  # "parquet" or "xlsx"
+    # Derived from REQUIRED_COLUMNS for O(1) membership checks
+    REQUIRED_COLUMNS_SET: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'REQUIRED_COLUMNS_SET', frozenset(self.REQUIRED_COLUMNS))
     
 class ValidationError(Exception):
     """Custom exception for data validation errors."""
@@ -86,28 +104,35 @@ class DataValidator:
         Raises:
             ValidationError: If negative values are found
         """
-        for col in columns:
-            if (df[col] < 0).any():
-                negative_rows = df[df[col] < 0]
-                raise ValidationError(
-                    f"Negative values found in column {col}. "
-                    f"Rows: {negative_rows.index.tolist()}"
-                )
+        # One comparison over the whole numeric block; the offending column
+        # and rows are only located when the check fails
+        negative = df[list(columns)].to_numpy() < 0
+        if negative.any():
+            col_idx = int(negative.any(axis=0).argmax())
+            raise ValidationError(
+                f"Negative values found in column {columns[col_idx]}. "
+                f"Rows: {df.index[negative[:, col_idx]].tolist()}"
+            )
     
     @staticmethod
-    def validate_required_columns(df: pd.DataFrame, required_cols: list) -> None:
+    def validate_required_columns(df: pd.DataFrame, required_cols: Tuple[str, ...],
+                                  required_set: Optional[FrozenSet[str]] = None) -> None:
         """
         Validates that all required columns are present.
         
         Args:
             df: DataFrame to validate
             required_cols: List of required column names
+            required_set: Precomputed set of required_cols, if available
             
         Raises:
             ValidationError: If any required columns are missing
         """
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
+        if required_set is None:
+            required_set = frozenset(required_cols)
+        missing = required_set.difference(df.columns)
+        if missing:
+            missing_cols = [col for col in required_cols if col in missing]
             raise ValidationError(f"Required columns missing: {', '.join(missing_cols)}")
 
 class MRPAnalyzer:
@@ -118,20 +143,21 @@ class MRPAnalyzer:
         self.validator = DataValidator()
     
     @staticmethod
-    def _calculate_available_stock(df: pd.DataFrame) -> pd.Series:
+    def _calculate_available_stock(estq10: np.ndarray, estq20: np.ndarray) -> np.ndarray:
         """Calculates available stock considering ESTQ10 and ESTQ20."""
-        return np.add(df["ESTQ10"], np.divide(df["ESTQ20"], 3))
+        return estq10 + estq20 / 3
     
     @staticmethod
-    def _calculate_required_quantity(df: pd.DataFrame) -> pd.Series:
+    def _calculate_required_quantity(demand: np.ndarray, available: np.ndarray,
+                                     safety_stock: np.ndarray, orders: np.ndarray) -> np.ndarray:
         """Calculates the quantity to be ordered."""
-        return (
-            df["DEMANDAMRP"] - df["ESTOQUE DISPONÍVEL"] + 
-            df["ESTOQSEG"] - df["PEDIDOS"]
-        ).clip(lower=0).round().astype(int)
+        return np.rint(
+            np.clip(demand - available + safety_stock - orders, 0, None)
+        ).astype(np.int32)
     
     def analyze(self, input_file: str, sheet_name: str, 
-               output_file: str = 'itens_criticos.xlsx') -> Tuple[Optional[int], Optional[str], Optional[pd.DataFrame]]:
+               output_file: str = 'itens_criticos.xlsx',
+               excel_file: Optional[pd.ExcelFile] = None) -> Tuple[Optional[int], Optional[str], Optional[pd.DataFrame]]:
         """
         Performs MRP analysis from Excel file, saves results and history, returns critical items count.
         
@@ -139,6 +165,8 @@ class MRPAnalyzer:
             input_file: Path to input Excel file
             sheet_name: Name of the worksheet to analyze
             output_file: Path to save results
+            excel_file: Optional already opened workbook of input_file
+                        (see open_excel), read instead of reopening the file
             
         Returns:
             Tuple containing:
@@ -152,30 +180,44 @@ class MRPAnalyzer:
             if not os.path.exists(input_file):
                 raise FileNotFoundError(f"File not found: {input_file}")
             
-            # Optimized Excel reading
-            df = pd.read_excel(
-                input_file,
+            # Optimized Excel reading (calamine when available); columns that
+            # are not required are skipped instead of being converted
+            required = self.config.REQUIRED_COLUMNS_SET
+            df = read_excel_fast(
+                excel_file if excel_file is not None else input_file,
                 sheet_name=sheet_name,
+                usecols=lambda col: str(col).strip().upper() in required,
                 dtype={col: 'float64' for col in self.config.NUMERIC_COLUMNS}
             )
             
             # Normalize and validate columns
-            df.columns = [col.strip().upper() for col in df.columns]
-            self.validator.validate_required_columns(df, self.config.REQUIRED_COLUMNS)
+            df.columns = df.columns.astype(str).str.strip().str.upper()
+            self.validator.validate_required_columns(
+                df, self.config.REQUIRED_COLUMNS, self.config.REQUIRED_COLUMNS_SET
+            )
             self.validator.validate_numeric_columns(df, self.config.NUMERIC_COLUMNS)
             self.validator.validate_positive_values(df, self.config.NUMERIC_COLUMNS)
             
-            # Optimized calculations using numpy
-            df["ESTOQUE DISPONÍVEL"] = self._calculate_available_stock(df)
-            mask = (df["ESTOQUE DISPONÍVEL"] - df["DEMANDAMRP"]) < df["ESTOQSEG"]
-            critical_items = df[mask].copy()
+            # Calculations run on plain NumPy arrays; only critical rows are kept
+            estq10, estq20, demand, safety_stock, orders = (
+                df[col].to_numpy(dtype=np.float64)
+                for col in ("ESTQ10", "ESTQ20", "DEMANDAMRP", "ESTOQSEG", "PEDIDOS")
+            )
+            available = self._calculate_available_stock(estq10, estq20)
+            mask = (available - demand) < safety_stock
+            available = available[mask]
             
-            critical_items["QUANTIDADE A SOLICITAR"] = self._calculate_required_quantity(critical_items)
-            critical_items["FORNECEDOR PRINCIPAL"] = critical_items["FORNECEDORPRINCIPAL"]
-            critical_items["ESTOQUE DISPONÍVEL"] = critical_items["ESTOQUE DISPONÍVEL"].round().astype(int)
+            critical_items = df.loc[mask]
+            critical_items = critical_items.assign(**{
+                "FORNECEDOR PRINCIPAL": critical_items["FORNECEDORPRINCIPAL"],
+                "ESTOQUE DISPONÍVEL": np.rint(available).astype(np.int32),
+                "QUANTIDADE A SOLICITAR": self._calculate_required_quantity(
+                    demand[mask], available, safety_stock[mask], orders[mask]
+                )
+            })
             
             # Prepare final output
-            output_df = critical_items[self.config.OUTPUT_COLUMNS].fillna("")
+            output_df = critical_items[list(self.config.OUTPUT_COLUMNS)].fillna("")
             self._save_results(output_df, output_file)
             
             return len(output_df), None, output_df
@@ -190,35 +232,84 @@ class MRPAnalyzer:
     def _save_results(self, df: pd.DataFrame, output_file: str) -> None:
         """Saves results and creates a historical copy."""
         self._save_formatted_excel(df, output_file)
-        self._save_history(df, output_file)
+        parquet_path = self._save_parquet_copy(df, output_file)
+        self._save_history(output_file, parquet_path)
+    
+    def _save_parquet_copy(self, df: pd.DataFrame, output_file: str) -> Optional[Path]:
+        """
+        Saves a Parquet copy next to the Excel output for fast reloading.
+        
+        The Excel file remains the user-facing result; the copy only speeds up
+        loading results back, so failures are logged and otherwise ignored.
+        
+        Returns:
+            Path of the Parquet copy, or None if it could not be written
+        """
+        parquet_path = Path(output_file).with_suffix('.parquet')
+        # Parquet needs one type per column; codes and notes often mix
+        # numbers and text, so text columns are written as strings
+        text_columns = [col for col, dtype in df.dtypes.items() if dtype == object]
+        try:
+            df.astype({col: str for col in text_columns}).to_parquet(parquet_path, index=False)
+            logger.info(f"Parquet copy saved to: {parquet_path}")
+            return parquet_path
+        except Exception as e:
+            logger.warning(f"Could not save Parquet copy: {str(e)}")
+            return None
     
-    def _save_history(self, df: pd.DataFrame, output_file: str) -> None:
-        """Saves a historical copy of the file with timestamp."""
+    def _save_history(self, output_file: str, parquet_path: Optional[Path] = None) -> None:
+        """
+        Saves a historical copy of the file with timestamp.
+        
+        The copy is taken from a file already written for this result, in
+        HISTORY_FORMAT; the workbook is used when no Parquet copy exists.
+        """
+        if self.config.HISTORY_FORMAT == "parquet" and parquet_path is not None:
+            source = parquet_path
+        else:
+            source = Path(output_file)
         hist_dir = Path(output_file).parent / self.config.HISTORY_DIR
         hist_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        hist_path = hist_dir / f"itens_criticos_{timestamp}.xlsx"
-        self._save_formatted_excel(df, str(hist_path))
+        hist_path = hist_dir / f"itens_criticos_{timestamp}{source.suffix}"
+        # Copy the finished file instead of writing the results a second time
+        shutil.copyfile(source, hist_path)
         logger.info(f"History saved to: {hist_path}")
     
     def _save_formatted_excel(self, df: pd.DataFrame, output_file: str) -> None:
-        """Saves DataFrame to Excel with formatting."""
-        writer = pd.ExcelWriter(output_file, engine='xlsxwriter')
-        df.to_excel(writer, sheet_name="Critical Items", index=False)
-        self._format_excel(writer, df)
+        """
+        Saves DataFrame to Excel with formatting.
+        
+        The workbook is written in xlsxwriter's constant_memory mode, which
+        flushes each row as soon as the next one starts. Rows must be written
+        in order, so the formatted header and sheet settings come first and
+        the data is appended below them row by row (to_excel writes column
+        by column, which this mode does not support).
+        """
+        writer = pd.ExcelWriter(
+            output_file,
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True, 'strings_to_numbers': False}}
+        )
+        write_row = self._format_excel(writer, df).write_row
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            write_row(row_idx, 0, row)
         writer.close()
         logger.info(f"Excel file saved to: {output_file}")
 
-    def _format_excel(self, writer: pd.ExcelWriter, df: pd.DataFrame) -> None:
+    def _format_excel(self, writer: pd.ExcelWriter, df: pd.DataFrame) -> Any:
         """
-        Formats Excel spreadsheet with styles and highlights.
+        Creates the results worksheet with styles and highlights.
         
         Args:
             writer: Excel writer object
             df: DataFrame to format
+            
+        Returns:
+            The xlsxwriter worksheet, ready for the data rows
         """
         workbook = writer.book
-        worksheet = writer.sheets['Critical Items']
+        worksheet = workbook.add_worksheet('Critical Items')
 
         # Define formats
         formats = {
@@ -250,32 +341,169 @@ class MRPAnalyzer:
             worksheet.write(0, col_num, value, formats['header'])
 
         # Set column formats and widths
-        for i, col in enumerate(df.columns):
-            fmt = formats['integer'] if pd.api.types.is_numeric_dtype(df[col]) else formats['text']
+        for i, dtype in enumerate(df.dtypes):
+            fmt = formats['integer'] if pd.api.types.is_numeric_dtype(dtype) else formats['text']
             worksheet.set_column(i, i, 20, fmt)
 
         # Add worksheet features
         worksheet.freeze_panes(1, 0)
         worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
 
-        # Write data with conditional formatting
-        for row_idx, row in enumerate(df.itertuples(index=False), start=1):
-            for col_idx, value in enumerate(row):
-                fmt = (formats['highlight'] 
-                      if df.columns[col_idx] == "QUANTIDADE A SOLICITAR" 
-                         and isinstance(value, (int, float)) and value > 0 
-                      else formats['alternate_row'] if row_idx % 2 == 0 
-                      else None)
-                worksheet.write(row_idx, col_idx, value, fmt)
+        # Highlight quantities to order and shade alternate rows; the data
+        # rows are written afterwards. Rules added first take priority.
+        if len(df) == 0:
+            return worksheet
+        if "QUANTIDADE A SOLICITAR" in df.columns:
+            qty_col = df.columns.get_loc("QUANTIDADE A SOLICITAR")
+            worksheet.conditional_format(1, qty_col, len(df), qty_col, {
+                'type': 'cell',
+                'criteria': '>',
+                'value': 0,
+                'format': formats['highlight']
+            })
+        worksheet.conditional_format(1, 0, len(df), len(df.columns) - 1, {
+            'type': 'formula',
+            'criteria': '=MOD(ROW(),2)=1',
+            'format': formats['alternate_row']
+        })
+        return worksheet
+
+
+@lru_cache(maxsize=1)
+def open_excel(path: str, mtime: float) -> pd.ExcelFile:
+    """
+    Opens an Excel workbook once per path and modification time.
+    
+    Listing the sheets and reading one of them share the same parsed
+    workbook, and re-running an analysis on an unchanged file reuses it.
+    The file is read into memory so no handle stays open on it; only the
+    most recent workbook is kept.
+    
+    Args:
+        path: Path to the Excel file
+        mtime: Modification time of the file, so edited files are reopened
+        
+    Returns:
+        pd.ExcelFile: Opened workbook
+    """
+    return pd.ExcelFile(io.BytesIO(Path(path).read_bytes()), engine=EXCEL_READ_ENGINE)
+
+
+def read_excel_fast(path, **kwargs) -> pd.DataFrame:
+    """
+    Reads an Excel worksheet using the fastest engine available.
+    
+    Uses calamine when available. Otherwise plain .xlsx reads that only
+    need a sheet and column dtypes are streamed with openpyxl, and anything
+    else falls back to pandas' default engine.
+    
+    Args:
+        path: Path to the Excel file, or a workbook opened by open_excel
+        **kwargs: Additional keyword arguments for pd.read_excel
+        
+    Returns:
+        DataFrame with the worksheet contents
+    """
+    if isinstance(path, pd.ExcelFile):
+        return pd.read_excel(path, **kwargs)
+    if (EXCEL_READ_ENGINE is None
+            and Path(path).suffix.lower() in ('.xlsx', '.xlsm')
+            and set(kwargs) <= {'sheet_name', 'dtype', 'usecols'}):
+        return _read_excel_streaming(path, **kwargs)
+    return pd.read_excel(path, engine=EXCEL_READ_ENGINE, **kwargs)
+
+
+def _read_excel_streaming(path, sheet_name=0, dtype: Optional[Dict[str, Any]] = None,
+                           usecols=None) -> pd.DataFrame:
+    """
+    Streams a worksheet into a DataFrame using openpyxl's read-only mode.
+    
+    Rows are read as plain value tuples, skipping the per-cell conversion
+    pandas' openpyxl reader performs. The result matches pd.read_excel:
+    trailing blank rows and columns (e.g. styled but empty cells) are
+    dropped, the first row is used as header, and blank or duplicate
+    header names become "Unnamed: n" / "name.1".
+    
+    Args:
+        path: Path to the .xlsx file
+        sheet_name: Worksheet name or zero-based position
+        dtype: Optional mapping of column name to dtype
+        usecols: Optional column names to keep, or a callable that
+                 receives each header name and returns whether to keep it
+        
+    Returns:
+        DataFrame with the worksheet contents
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            worksheet = workbook.worksheets[sheet_name]
+        else:
+            worksheet = workbook[sheet_name]
+        rows = list(worksheet.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+    
+    # Trailing rows and cells that are blank are not part of the table
+    while rows and not _filled_width(rows[-1]):
+        rows.pop()
+    width = max((_filled_width(row) for row in rows), default=0)
+    header = _header_names(tuple(rows[0][:width]) + (None,) * (width - len(rows[0])) if rows else ())
+    positions = range(width)
+    if usecols is not None:
+        keep = usecols if callable(usecols) else set(usecols).__contains__
+        positions = [i for i in positions if keep(header[i])]
+    df = pd.DataFrame(
+        [[row[i] if i < len(row) else None for i in positions] for row in rows[1:]],
+        columns=[header[i] for i in positions]
+    )
+    
+    for col, col_dtype in (dtype or {}).items():
+        if col in df.columns:
+            # Keep empty cells missing instead of turning them into "None"
+            df[col] = df[col].astype('string' if col_dtype is str else col_dtype)
+    return df
+
+
+def _filled_width(row: Tuple[Any, ...]) -> int:
+    """Returns the length of a row without its trailing blank cells."""
+    width = len(row)
+    while width and (row[width - 1] is None or row[width - 1] == ""):
+        width -= 1
+    return width
+
+
+def _header_names(header: Tuple[Any, ...]) -> List[Any]:
+    """
+    Names header cells the way pd.read_excel does.
+    
+    Blank cells become "Unnamed: <position>" and repeated names get a
+    ".1", ".2", ... suffix.
+    """
+    names = [
+        f"Unnamed: {i}" if name is None or name == "" else name
+        for i, name in enumerate(header)
+    ]
+    counts: Dict[Any, int] = {}
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
 
 
-def analyze_mrp(input_file: str, sheet_name: str, output_file: str = 'itens_criticos.xlsx') -> Tuple[Optional[int], Optional[str], Optional[pd.DataFrame]]:
+def analyze_mrp(input_file: str, sheet_name: str, output_file: str = 'itens_criticos.xlsx',
+                excel_file: Optional[pd.ExcelFile] = None) -> Tuple[Optional[int], Optional[str], Optional[pd.DataFrame]]:
     """
     Convenience function for backward compatibility.
     Performs MRP analysis using the MRPAnalyzer class.
     """
     analyzer = MRPAnalyzer()
-    return analyzer.analyze(input_file, sheet_name, output_file)
+    return analyzer.analyze(input_file, sheet_name, output_file, excel_file)
 
 
 if __name__ == "__main__":
@@ -9,26 +9,38 @@ Version: 1.0.0
 
 import os
 import time
-import json
-import webbrowser
+import hashlib
+import zipfile
+from xml.etree import ElementTree
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Iterator, Callable
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import orjson
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from ttkbootstrap import Style
 from ttkbootstrap.tooltip import ToolTip
 
-from mrp_analyzer import MRPAnalyzer, MRPConfig
+from mrp_analyzer import (
+    EXCEL_READ_ENGINE, MRPAnalyzer, MRPConfig, open_excel, read_excel_fast
+)
 
 # Configure logging
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Arrow-backed string dtype for text columns held in memory
+ARROW_STRING = pd.StringDtype("pyarrow")
+
 
 @dataclass
 class GUIConfig:
@@ -53,6 +65,9 @@ class GUIConfig:
     config_dir: Path = field(default_factory=lambda: Path.home() / '.mrp_analyzer')
     config_file: Path = field(default_factory=lambda: Path.home() / '.mrp_analyzer' / 'config.json')
     
+    # Digest of the last contents read from or written to config_file
+    _saved_digest: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Ensures configuration directory exists after initialization."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -65,22 +80,48 @@ class GUIConfig:
         Returns:
             GUIConfig: Loaded or default configuration
         """
+        default = cls()
         try:
-            if cls.config_file.exists():
-                with open(cls.config_file) as f:
-                    return cls(**json.load(f))
+            if default.config_file.exists():
+                config = cls(**orjson.loads(default.config_file.read_bytes()))
+                config._saved_digest = config._digest(config._serialize())
+                return config
         except Exception as e:
             logger.error(f"Error loading config: {e}")
-        return cls()
+        return default
     
     def save(self) -> None:
-        """Saves current configuration to file."""
+        """
+        Saves current configuration to file.
+        
+        The file is only rewritten when its contents would change, and is
+        replaced atomically so an interrupted write cannot corrupt it.
+        """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.__dict__, f, indent=2)
+            data = self._serialize()
+            digest = self._digest(data)
+            if digest == self._saved_digest:
+                return
+            tmp_file = self.config_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_digest = digest
             logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
+    
+    def _serialize(self) -> bytes:
+        """Serializes the persisted settings (paths and internal state excluded)."""
+        settings = {
+            key: value for key, value in self.__dict__.items()
+            if not key.startswith('_') and not isinstance(value, Path)
+        }
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        """Returns a short digest used to detect unchanged configuration."""
+        return hashlib.blake2b(data, digest_size=8).digest()
 
 @dataclass
 class AppState:
@@ -89,6 +130,7 @@ class AppState:
     config: GUIConfig = field(default_factory=GUIConfig.load)
     
     # Data state
+    df_source: pd.DataFrame = field(default_factory=pd.DataFrame)
     df_table: pd.DataFrame = field(default_factory=pd.DataFrame)
     current_page: int = field(default=0)
     total_pages: int = field(default=0)
@@ -136,6 +178,20 @@ class MRPGUI:
     Handles all user interface elements and interactions.
     """
     
+    # Foreground colors for log messages and the analysis status label
+    LOG_COLORS = {"info": "#222", "success": "#155724", "error": "#721c24"}
+    STATUS_COLORS = {"running": "#007bff", "success": "#28a745", "error": "#dc3545"}
+    
+    # Idle time before deferred table statistics are computed
+    STATS_DELAY_MS = 50
+    
+    # Column types used when loading analysis results into the table
+    TABLE_DTYPES = {
+        'CÓD': str,
+        'QUANTIDADE A SOLICITAR': 'Int64',
+        'ESTOQUE DISPONÍVEL': 'Int64'
+    }
+    
     def __init__(self, root: tk.Tk):
         """
         Initialize the GUI application.
@@ -146,14 +202,25 @@ class MRPGUI:
         self.root = root
         self._initialize_state()
         self._setup_window()
+        self._setup_style()
         self._create_variables()
         self._setup_bindings()
         self._build_ui()
         
     def _initialize_state(self) -> None:
-        """Initialize application state and styling."""
+        """Initialize application state."""
         self.state = AppState()
-        self.style = Style(self.state.config.theme)
+        self._sheet_cache: Dict[Tuple[str, float], List[str]] = {}
+        self._last_cols: Tuple[str, ...] = ()
+        self._lower_cache: Dict[str, pa.Array] = {}
+        self._sort_order: Optional[np.ndarray] = None
+        self._filter_executor = ThreadPoolExecutor(max_workers=1)
+        self._analysis_executor = ThreadPoolExecutor(max_workers=1)
+        self._analysis_future: Optional[Future] = None
+        self._filter_generation = 0
+        self._cache_stat_columns()
+        self._stats_cache = self._calculate_statistics(self.state.df_source)
+        self._pending_stats: Optional[Tuple[str, Callable[[], Dict[str, Any]]]] = None
         logger.info("Application state initialized")
         
     def _setup_window(self) -> None:
@@ -168,6 +235,17 @@ class MRPGUI:
         icon_path = Path(__file__).parent / "assets" / "icon.ico"
         if icon_path.exists():
             self.root.iconbitmap(str(icon_path))
+
+    def _setup_style(self) -> None:
+        """
+        Applies the ttkbootstrap theme once the empty window is on screen.
+        
+        Building the theme resources is the slowest part of startup, so the
+        window is painted first. Style is a singleton, so every widget built
+        afterwards picks up the theme.
+        """
+        self.root.update()
+        self.style = Style(self.state.config.theme)
             
     def _create_variables(self) -> None:
         """Initialize Tkinter variables."""
@@ -181,6 +259,9 @@ class MRPGUI:
         # Comparison variables
         self.compare_before = None
         self.compare_after = None
+        self._compare_df: Optional[pd.DataFrame] = None
+        self._last_compare_cols: Tuple[str, ...] = ()
+        self._compare_page = 0
         
     def _setup_bindings(self) -> None:
         """Setup keyboard shortcuts and event bindings."""
@@ -211,12 +292,15 @@ class MRPGUI:
             self.state.config.window_size = (self.root.winfo_width(), self.root.winfo_height())
             self.state.save_state()
         finally:
+            self._filter_executor.shutdown(wait=False)
+            self._analysis_executor.shutdown(wait=False)
             self.root.destroy()
             
     def _on_window_configure(self, event):
         """Handler para redimensionamento da janela."""
+        # Only remember the size here; it is persisted once, on close
         if event.widget == self.root:
-            pass
+            self.state.config.window_size = (event.width, event.height)
 
     def _toggle_theme(self):
         self.theme = "darkly" if self.theme == "flatly" else "flatly"
@@ -283,6 +367,8 @@ class MRPGUI:
         self.log_text.config(yscrollcommand=scrollbar.set)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for level, color in self.LOG_COLORS.items():
+            self.log_text.tag_config(level, foreground=color)
 
     def _browse_file(self):
         file = filedialog.askopenfilename(filetypes=[("Excel Spreadsheets", "*.xlsx *.xls")])
@@ -291,16 +377,38 @@ class MRPGUI:
             self._log(f"Selected file: {os.path.basename(file)}", "info")
 
     def _log(self, msg, level="info"):
-        color = {"info": "#222", "success": "#155724", "error": "#721c24"}.get(level, "#222")
         self.log_text.insert(tk.END, f"{msg}\n", (level,))
-        self.log_text.tag_config(level, foreground=color)
         self.log_text.see(tk.END)
 
+    @staticmethod
+    @contextmanager
+    def _suspend_layout(tree: ttk.Treeview) -> Iterator[ttk.Treeview]:
+        """
+        Hides all columns of a Treeview while rows are bulk-inserted.
+        
+        With no display columns Tk skips the per-insert layout pass, so the
+        tree is laid out once when the columns are restored.
+        
+        Args:
+            tree: Treeview about to receive many inserts
+        """
+        display_columns = tree.cget("displaycolumns")
+        tree.configure(displaycolumns=())
+        try:
+            yield tree
+        finally:
+            tree.configure(displaycolumns=display_columns)
+
     def _run_analysis(self) -> None:
         """
         Executes MRP analysis with enhanced feedback and robust error handling.
         Runs the analysis in a separate thread to prevent UI freezing.
+        Requests made while an analysis is still running are ignored.
         """
+        if self._analysis_future is not None and not self._analysis_future.done():
+            self._log("An analysis is already running.", "info")
+            return
+        
         try:
             file_path = Path(self.selected_file.get())
             sheet_name = self.sheet_name.get()
@@ -308,8 +416,11 @@ class MRPGUI:
             self._validate_analysis_input(file_path, sheet_name)
             self._start_analysis_feedback()
             
-            # Schedule analysis execution
-            self.root.after(100, lambda: self._execute_analysis(file_path, sheet_name))
+            # Run the analysis on the worker thread and poll for its outcome
+            self._analysis_future = self._analysis_executor.submit(
+                self._execute_analysis, file_path, sheet_name
+            )
+            self.root.after(100, self._poll_analysis, self._analysis_future)
             
         except Exception as e:
             self._handle_analysis_error(str(e))
@@ -350,51 +461,120 @@ class MRPGUI:
             bool: True if sheet exists, False otherwise
         """
         try:
-            return sheet_name in pd.ExcelFile(file_path).sheet_names
+            return sheet_name in self._get_sheet_names(file_path)
         except Exception as e:
             logger.error(f"Error validating sheet: {e}")
             return False
+
+    def _get_sheet_names(self, file_path: Path) -> List[str]:
+        """
+        Returns the worksheet names of an Excel file, cached by path and mtime.
+        
+        For xlsx/xlsm files the names come from the workbook part of the zip
+        package; no worksheet, shared string or style data is parsed. Other
+        formats are opened through open_excel, which parses the whole file,
+        and the analysis reuses that workbook.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            List[str]: Worksheet names in workbook order
+        """
+        key = (str(file_path), os.stat(file_path).st_mtime)
+        names = self._sheet_cache.get(key)
+        if names is None:
+            if file_path.suffix.lower() in ('.xlsx', '.xlsm'):
+                names = self._read_xlsx_sheet_names(file_path)
+            else:
+                names = self._open_workbook(file_path).sheet_names
+            self._sheet_cache = {key: names}
+        return names
+
+    @staticmethod
+    def _read_xlsx_sheet_names(file_path: Path) -> List[str]:
+        """Reads the worksheet names listed in an xlsx package's workbook part."""
+        with zipfile.ZipFile(file_path) as archive:
+            relationships = ElementTree.fromstring(archive.read('_rels/.rels'))
+            workbook_part = next(
+                rel.get('Target', '') for rel in relationships
+                if rel.get('Type', '').endswith('/officeDocument')
+            ).lstrip('/')
+            workbook = ElementTree.fromstring(archive.read(workbook_part))
+        return [
+            element.get('name') for element in workbook.iter()
+            if element.tag.rsplit('}', 1)[-1] == 'sheet'
+        ]
+
+    @staticmethod
+    def _open_workbook(file_path: Path) -> pd.ExcelFile:
+        """Returns the cached open workbook for the current version of a file."""
+        return open_excel(str(file_path), os.stat(file_path).st_mtime)
             
     def _start_analysis_feedback(self) -> None:
         """Configures visual feedback for analysis progress."""
         self.progress.start()
-        self.status_label.config(
+        self.status_label.configure(
             text="Analyzing...",
-            foreground="#007bff"
+            foreground=self.STATUS_COLORS["running"]
         )
         self._log("Starting analysis...", "info")
-        self.root.update_idletasks()
         
-    def _execute_analysis(self, file_path: Path, sheet_name: str) -> None:
+    def _execute_analysis(self, file_path: Path,
+                          sheet_name: str) -> Tuple[Path, int, float, pd.DataFrame]:
         """
         Executes the MRP analysis with performance measurement.
         
+        Runs on the analysis worker thread, so it never touches Tk widgets.
+        
         Args:
             file_path: Path to the input Excel file
             sheet_name: Name of the worksheet to analyze
-        """
-        try:
-            start_time = time.time()
             
-            output_file = (file_path.parent / 
-                         f"itens_criticos_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
-            
-            # Execute analysis using MRPAnalyzer
-            count, error, results = self.state.mrp_analyzer.analyze(
-                str(file_path), 
-                sheet_name, 
-                str(output_file)
-            )
+        Returns:
+            Tuple of output file, critical item count, elapsed seconds and
+            the results DataFrame
             
-            if error:
-                raise Exception(error)
-                
-            self._handle_analysis_success(output_file, count, time.time() - start_time, results)
+        Raises:
+            Exception: If the analysis reports an error
+        """
+        start_time = time.time()
+        
+        output_file = (file_path.parent / 
+                     f"itens_criticos_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
+        
+        # Execute analysis using MRPAnalyzer
+        count, error, df_result = self.state.mrp_analyzer.analyze(
+            str(file_path), 
+            sheet_name, 
+            str(output_file),
+            # Only calamine benefits from the shared workbook; without it the
+            # analyzer streams the file from disk with openpyxl
+            excel_file=self._open_workbook(file_path) if EXCEL_READ_ENGINE else None
+        )
+        
+        if error:
+            raise Exception(error)
             
+        return output_file, count, time.time() - start_time, df_result
+
+    def _poll_analysis(self, future: Future) -> None:
+        """
+        Waits for the analysis worker and finalizes the UI on the Tk thread.
+        
+        Args:
+            future: Pending result of _execute_analysis
+        """
+        if not future.done():
+            self.root.after(100, self._poll_analysis, future)
+            return
+        try:
+            result = future.result()
         except Exception as e:
             self._handle_analysis_error(str(e))
-        finally:
-            self.progress.stop()
+            return
+        self.progress.stop()
+        self._handle_analysis_success(*result)
             
     def _handle_analysis_success(self, output_file: Path, count: int, 
                                elapsed: float, results: pd.DataFrame) -> None:
@@ -413,7 +593,7 @@ class MRPGUI:
         self._update_success_ui(elapsed, output_file)
         
         # Load results into table
-        self._load_table(output_file)
+        self._load_table(output_file, results)
         self.notebook.select(self.tab_table)
         
         # Show success message and offer to open file
@@ -432,9 +612,9 @@ class MRPGUI:
             f"Analysis completed in {elapsed}s", 
             "success"
         )
-        self.status_label.config(
+        self.status_label.configure(
             text=f"Output file: {output_file.name}",
-            foreground="#28a745"
+            foreground=self.STATUS_COLORS["success"]
         )
         
     def _show_success_dialog(self, count: int, elapsed: float, 
@@ -461,6 +641,8 @@ class MRPGUI:
         Args:
             file_path: Path to the file to open
         """
+        import webbrowser
+
         try:
             webbrowser.open(str(file_path))
             logger.info(f"Opened output file: {file_path}")
@@ -483,9 +665,9 @@ class MRPGUI:
         
         # Update UI
         self._log(f"Error during analysis: {error}", "error")
-        self.status_label.config(
+        self.status_label.configure(
             text="Analysis failed",
-            foreground="#dc3545"
+            foreground=self.STATUS_COLORS["error"]
         )
         
         # Show error dialog
@@ -496,11 +678,10 @@ class MRPGUI:
         
         # Reset progress
         self.progress.stop()
-        self.root.update_idletasks()
 
     def _validate_sheet(self, file, sheet):
         try:
-            return sheet in pd.ExcelFile(file).sheet_names
+            return sheet in self._get_sheet_names(Path(file))
         except Exception as e:
             self._log(f"Error validating sheet: {e}", "error")
             return False
@@ -534,9 +715,9 @@ class MRPGUI:
         btn_filter = ttk.Button(filter_frame, text="Apply Filter", command=self._apply_filter)
         btn_filter.pack(side=tk.LEFT, padx=5)
         ToolTip(btn_filter, text="Apply filter to table")
-        btn_reload = ttk.Button(filter_frame, text="Reload", command=self._load_table)
+        btn_reload = ttk.Button(filter_frame, text="Reload", command=self._reset_table)
         btn_reload.pack(side=tk.LEFT)
-        ToolTip(btn_reload, text="Reload table from file")
+        ToolTip(btn_reload, text="Clear filters and show all loaded rows")
 
         btn_export_excel = ttk.Button(filter_frame, text="Export Excel", command=self._export_excel)
         btn_export_excel.pack(side=tk.RIGHT, padx=5)
@@ -547,6 +728,7 @@ class MRPGUI:
 
         self.tree = ttk.Treeview(self.tab_table, show="headings")
         self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.tag_configure('oddrow', background="#f9f9f9")
 
         nav_frame = ttk.Frame(self.tab_table)
         nav_frame.pack(fill=tk.X, pady=10)
@@ -559,30 +741,39 @@ class MRPGUI:
         btn_prev = ttk.Button(btn_frame, text="Previous", command=self._prev_page)
         btn_prev.pack(side=tk.LEFT, padx=5)
         ToolTip(btn_prev, text="Previous page")
+        self.page_label = ttk.Label(btn_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
         btn_next = ttk.Button(btn_frame, text="Next", command=self._next_page)
         btn_next.pack(side=tk.LEFT)
         ToolTip(btn_next, text="Next page")
 
-    def _load_table(self, path: Optional[Path] = None) -> None:
+    def _load_table(self, path: Optional[Path] = None,
+                    df: Optional[pd.DataFrame] = None) -> None:
         """
         Loads and displays table data from an Excel file.
         
         Args:
             path: Optional path to the Excel file. If not provided,
                   uses the last analysis file.
+            df: Optional result DataFrame already in memory (e.g. returned
+                by the analyzer); when given, the file is not read.
         """
         try:
             file_path = path or Path(self.selected_file.get()).parent / "itens_criticos.xlsx"
             
             # Load data with optimized settings
-            self.state.df_table = pd.read_excel(
-                file_path,
-                dtype={
-                    'CÓD': str,
-                    'QUANTIDADE A SOLICITAR': 'Int64',
-                    'ESTOQUE DISPONÍVEL': 'Int64'
-                }
-            )
+            if df is not None:
+                self.state.df_source = self._normalize_result(df)
+            else:
+                self.state.df_source = self._fastest_load(Path(file_path))
+            self._categorize_columns(self.state.df_source)
+            self.state.df_table = self.state.df_source
+            self.state.filter_applied = False
+            self._reset_sort()
+            self._cache_stat_columns()
+            self._recompute_stats()
+            self._lower_cache = {}
+            self._filter_generation += 1
             
             # Update UI elements
             self.column_box['values'] = list(self.state.df_table.columns)
@@ -598,6 +789,100 @@ class MRPGUI:
             self._log(f"Error loading table: {str(e)}", "error")
             messagebox.showerror("Error", f"Failed to load table: {str(e)}")
 
+    def _reset_table(self) -> None:
+        """
+        Clears filters and sorting, showing all loaded rows again.
+        
+        The unfiltered table is kept in memory, so this does no disk I/O;
+        the file is only read when nothing has been loaded yet.
+        """
+        if self.state.df_source.empty:
+            self._load_table()
+            return
+        
+        self.filter_value.set("")
+        self.qtd_min.set("")
+        self.qtd_max.set("")
+        self._filter_generation += 1
+        self.state.df_table = self.state.df_source
+        self.state.filter_applied = False
+        self._reset_sort()
+        self._recompute_stats()
+        self.state.current_page = 0
+        self.state.update_pagination()
+        self._render_table()
+
+    def _fastest_load(self, path: Path) -> pd.DataFrame:
+        """
+        Loads an analysis result, preferring its Parquet copy over the Excel file.
+        
+        The analyzer writes a Parquet copy next to each result; it is used
+        unless the Excel file is newer (e.g. edited by the user).
+        
+        Args:
+            path: Path to the result Excel file
+            
+        Returns:
+            DataFrame with the result table
+        """
+        parquet_path = path.with_suffix('.parquet')
+        if (parquet_path.exists() and
+                (not path.exists() or parquet_path.stat().st_mtime >= path.stat().st_mtime)):
+            return self._normalize_result(pd.read_parquet(parquet_path))
+        return read_excel_fast(path, dtype=self.TABLE_DTYPES)
+
+    def _normalize_result(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Gives an analyzer result the dtypes it has when read back from Excel.
+        
+        Args:
+            df: Result table as written by the analyzer
+            
+        Returns:
+            DataFrame where blank cells are missing values and whole-number
+            floats are integers
+        """
+        df = df.replace('', np.nan).reset_index(drop=True)
+        df = df.convert_dtypes(convert_string=False, convert_boolean=False)
+        return df.astype({col: dtype for col, dtype in self.TABLE_DTYPES.items()
+                          if col in df.columns})
+
+    @staticmethod
+    def _categorize_columns(df: pd.DataFrame) -> None:
+        """
+        Converts repetitive text columns (e.g. suppliers) to Categorical in place.
+        
+        Integer codes take far less memory than repeated Python strings and
+        make value counts, mode and sorting work on integer arrays. The
+        remaining text columns are stored as Arrow strings.
+        
+        Args:
+            df: Freshly loaded table
+        """
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            if df[col].nunique() < 0.5 * len(df):
+                df[col] = df[col].astype("category")
+            else:
+                df[col] = df[col].astype(ARROW_STRING)
+
+    @staticmethod
+    def _use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the text columns of a DataFrame to Arrow strings in place.
+        
+        Arrow keeps strings in contiguous buffers instead of boxed Python
+        objects, so merges and string operations run in Arrow's C++ kernels.
+        
+        Args:
+            df: Freshly loaded DataFrame
+            
+        Returns:
+            pd.DataFrame: The same DataFrame, for chaining
+        """
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            df[col] = df[col].astype(ARROW_STRING)
+        return df
+
     def _render_table(self) -> None:
         """
         Renders the table with efficient pagination and caching.
@@ -608,38 +893,69 @@ class MRPGUI:
         df = self.state.df_table
         
         if df.empty:
-            self._update_stats({
-                'total': 0,
-                'soma': 0,
-                'media': 0,
-                'top_forn': '-'
-            })
+            self._update_display_statistics()
             return
         
-        # Update statistics if needed
-        if not hasattr(self, '_stats_cache') or self.state.filter_applied:
-            self._stats_cache = self._calculate_statistics(df)
-            self.state.filter_applied = False
-        
-        if not self.tree["columns"]:
-            self.tree["columns"] = list(df.columns)
-            for col in df.columns:
+        # Configure columns only when the table schema changes
+        columns = tuple(df.columns)
+        if columns != self._last_cols:
+            self.tree["columns"] = columns
+            for col in columns:
                 self.tree.heading(col, text=col, command=lambda c=col: self._sort_column(c))
                 self.tree.column(col, width=120, anchor="center")
+            self._last_cols = columns
                 
         # Get current page data
         start_idx = self.state.current_page * self.state.config.page_size
         end_idx = start_idx + self.state.config.page_size
-        current_page = df.iloc[start_idx:end_idx]
+        if self._sort_order is None:
+            current_page = df.iloc[start_idx:end_idx]
+        else:
+            current_page = df.take(self._sort_order[start_idx:end_idx])
         
         # Render rows with alternating colors
-        for i, (_, row) in enumerate(current_page.iterrows()):
-            tags = ('oddrow',) if i % 2 else ('evenrow',)
-            self.tree.insert("", tk.END, values=list(row), tags=tags)
+        row_tags = (('evenrow',), ('oddrow',))
+        rows = list(current_page.itertuples(index=False, name=None))
+        insert, end = self.tree.insert, tk.END
+        with self._suspend_layout(self.tree):
+            for i, values in enumerate(rows):
+                insert("", end, values=values, tags=row_tags[i & 1])
 
         # Update statistics display
         self._update_display_statistics()
         
+    def _recompute_stats(self) -> None:
+        """
+        Recomputes the cached statistics for the whole loaded table.
+        
+        Only loading and filtering change the aggregates; sorting and paging
+        reuse the cache, so page flips never rescan the table.
+        """
+        self._schedule_stats(lambda: self._calculate_statistics(self.state.df_source))
+
+    def _schedule_stats(self, compute: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Defers a statistics computation until the table has been idle briefly.
+        
+        Args:
+            compute: Callable returning the new statistics dict
+        """
+        if self._pending_stats is not None:
+            self.root.after_cancel(self._pending_stats[0])
+        self._pending_stats = (self.root.after(self.STATS_DELAY_MS, self._refresh_stats), compute)
+
+    def _postpone_stats(self) -> None:
+        """Pushes back a pending statistics computation while the user navigates."""
+        if self._pending_stats is not None:
+            self._schedule_stats(self._pending_stats[1])
+
+    def _refresh_stats(self) -> None:
+        """Runs the pending statistics computation and updates the display."""
+        _, compute = self._pending_stats
+        self._pending_stats = None
+        self._stats_cache = compute()
+        self._update_display_statistics()
+
     def _calculate_statistics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Calculates table statistics.
@@ -659,14 +975,21 @@ class MRPGUI:
             }
             
             if "QUANTIDADE A SOLICITAR" in df.columns:
-                qty_series = df["QUANTIDADE A SOLICITAR"]
-                stats.update({
-                    'soma': int(qty_series.sum()),
-                    'media': round(qty_series.mean(), 2)
-                })
+                values = df["QUANTIDADE A SOLICITAR"].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+                count = np.count_nonzero(~np.isnan(values))
+                if count:
+                    total = np.nansum(values)
+                    stats.update({
+                        'soma': int(total),
+                        'media': round(total / count, 2)
+                    })
                 
             if "FORNECEDOR PRINCIPAL" in df.columns:
-                stats['top_forn'] = df["FORNECEDOR PRINCIPAL"].value_counts().idxmax()
+                modes = df["FORNECEDOR PRINCIPAL"].mode()
+                if not modes.empty:
+                    stats['top_forn'] = modes.iat[0]
                 
             return stats
             
@@ -678,57 +1001,264 @@ class MRPGUI:
                 'media': 0,
                 'top_forn': 'Error'
             }
+
+    def _cache_stat_columns(self) -> None:
+        """
+        Caches the statistics columns of the loaded table as NumPy arrays.
+        
+        Filters only produce a boolean mask over the loaded rows, so their
+        statistics are computed from these arrays without touching pandas.
+        Suppliers are stored as categorical codes (-1 for missing values).
+        """
+        df = self.state.df_source
+        if "QUANTIDADE A SOLICITAR" in df.columns:
+            self._qty_values = df["QUANTIDADE A SOLICITAR"].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+        else:
+            self._qty_values = None
+        if "FORNECEDOR PRINCIPAL" in df.columns:
+            suppliers = df["FORNECEDOR PRINCIPAL"].astype('category')
+            self._forn_codes = suppliers.cat.codes.to_numpy()
+            self._forn_categories = suppliers.cat.categories
+        else:
+            self._forn_codes = None
+
+    def _calculate_masked_statistics(self, mask: np.ndarray) -> Dict[str, Any]:
+        """
+        Calculates statistics for the loaded rows selected by a filter mask.
+        
+        Args:
+            mask: Boolean array with one entry per loaded row
+            
+        Returns:
+            Dict containing calculated statistics
+        """
+        stats = {
+            'total': int(mask.sum()),
+            'soma': 0,
+            'media': 0,
+            'top_forn': '-'
+        }
+        
+        if self._qty_values is not None:
+            values = self._qty_values[mask]
+            values = values[~np.isnan(values)]
+            if values.size:
+                stats.update({
+                    'soma': int(values.sum()),
+                    'media': round(values.mean(), 2)
+                })
+                
+        if self._forn_codes is not None:
+            codes = self._forn_codes[mask]
+            codes = codes[codes >= 0]
+            if codes.size:
+                stats['top_forn'] = self._forn_categories[np.bincount(codes).argmax()]
+                
+        return stats
             
     def _update_display_statistics(self) -> None:
         """Updates the statistics display in the UI."""
         stats = self._stats_cache
         
         # Update statistics label
-        self.stats_label.config(
-            text=(f"Total Items: {stats['total']} | "
-                  f"Total Quantity: {stats['soma']} | "
-                  f"Average: {stats['media']} | "
-                  f"Top Supplier: {stats['top_forn']}")
-        )
+        if self._pending_stats is not None:
+            self.stats_label.config(text="Calculating statistics...")
+        else:
+            self.stats_label.config(
+                text=(f"Total Items: {stats['total']} | "
+                      f"Total Quantity: {stats['soma']} | "
+                      f"Average: {stats['media']} | "
+                      f"Top Supplier: {stats['top_forn']}")
+            )
         
         # Update pagination label
         self.page_label.config(
             text=f"Page {self.state.current_page + 1} of {self.state.total_pages}"
         )
 
-    def _apply_filter(self):
-        df = self.df_table.copy()
-        col = self.filter_column.get()
-        val = self.filter_value.get().strip().lower()
-        min_qtd = self.qtd_min.get()
-        max_qtd = self.qtd_max.get()
+    def _apply_filter(self) -> None:
+        """
+        Filters the loaded table on a worker thread.
+        
+        The mask is computed off the Tk main thread so the window keeps
+        responding; the result is picked up by _poll_filter. Each request gets
+        a generation number so results of superseded filters are discarded.
+        """
+        self._filter_generation += 1
+        self.stats_label.configure(text="Filtering...")
+        future = self._filter_executor.submit(
+            self._compute_filter_mask,
+            self.state.df_source,
+            self._lower_cache,
+            self._qty_values,
+            self.filter_column.get(),
+            self.filter_value.get().strip().lower(),
+            self.qtd_min.get(),
+            self.qtd_max.get()
+        )
+        self.root.after(50, self._poll_filter, future, self._filter_generation)
 
+    def _compute_filter_mask(self, df: pd.DataFrame, lower_cache: Dict[str, pa.Array],
+                             qty_values: Optional[np.ndarray], col: str, val: str,
+                             min_qtd: str, max_qtd: str) -> np.ndarray:
+        """
+        Builds the boolean row mask for a filter (runs on the worker thread).
+        
+        Args:
+            df: Loaded table to filter
+            lower_cache: Lowercased column cache belonging to df
+            qty_values: Cached quantity array belonging to df
+            col: Column to search, or empty for no text filter
+            val: Lowercased text to search for
+            min_qtd: Minimum quantity as typed by the user
+            max_qtd: Maximum quantity as typed by the user
+            
+        Returns:
+            np.ndarray: Boolean mask with one entry per loaded row
+        """
+        # Filters always apply to the loaded rows, so they can be widened again.
+        # All conditions are combined into one mask and the rows taken once.
+        mask = np.ones(len(df), dtype=bool)
         if col and val:
-            df = df[df[col].astype(str).str.lower().str.contains(val)]
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                mask &= self._match_categories(df[col], val)
+            else:
+                matches = pc.match_substring(self._lowercase_column(df, lower_cache, col), val)
+                mask &= pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
 
-        if "QUANTIDADE A SOLICITAR" in df.columns:
+        if qty_values is not None:
             if min_qtd.isdigit():
-                df = df[df["QUANTIDADE A SOLICITAR"] >= int(min_qtd)]
+                mask &= qty_values >= int(min_qtd)
             if max_qtd.isdigit():
-                df = df[df["QUANTIDADE A SOLICITAR"] <= int(max_qtd)]
+                mask &= qty_values <= int(max_qtd)
+        return mask
 
-        self.df_table = df
-        self.current_page = 0
+    def _poll_filter(self, future: Future, generation: int) -> None:
+        """
+        Waits for a filter computation and applies its result on the Tk thread.
+        
+        Args:
+            future: Pending result of _compute_filter_mask
+            generation: Filter generation the future belongs to
+        """
+        if not future.done():
+            self.root.after(50, self._poll_filter, future, generation)
+            return
+        if generation != self._filter_generation:
+            return
+        try:
+            mask = future.result()
+        except Exception as e:
+            logger.error(f"Error applying filter: {e}")
+            self._log(f"Error applying filter: {e}", "error")
+            self._update_display_statistics()
+            return
+        self._finish_apply_filter(mask)
+
+    def _finish_apply_filter(self, mask: np.ndarray) -> None:
+        """
+        Displays the loaded rows selected by a filter mask.
+        
+        Args:
+            mask: Boolean array with one entry per loaded row
+        """
+        self.state.df_table = self.state.df_source.loc[mask]
+        self._reset_sort()
+        self.state.filter_applied = not mask.all()
+        self._schedule_stats(lambda: self._calculate_masked_statistics(mask))
+        self.state.current_page = 0
+        self.state.update_pagination()
         self._render_table()
 
-    def _sort_column(self, col):
-        self.df_table.sort_values(by=col, ascending=True, inplace=True, ignore_index=True)
-        self.current_page = 0
+    @staticmethod
+    def _match_categories(series: pd.Series, val: str) -> np.ndarray:
+        """
+        Matches a substring against a categorical column.
+        
+        Only the distinct categories are searched; rows are then selected by
+        indexing the per-category result with the integer codes.
+        
+        Args:
+            series: Categorical column of the loaded table
+            val: Lowercased text to search for
+            
+        Returns:
+            np.ndarray: Boolean mask with one entry per row
+        """
+        categories = pa.array(series.cat.categories.astype(ARROW_STRING))
+        hits = pc.match_substring(pc.utf8_lower(categories), val).to_numpy(zero_copy_only=False)
+        # Missing values have code -1, which picks the trailing False
+        return np.append(hits, False)[series.cat.codes.to_numpy()]
+
+    @staticmethod
+    def _lowercase_column(df: pd.DataFrame, lower_cache: Dict[str, pa.Array],
+                          col: str) -> pa.Array:
+        """
+        Returns a loaded column as a lowercased Arrow string array.
+        
+        The array is built by the filter worker on the first filter of a
+        column and reused by later filters until the table is reloaded, so
+        each filter is a single vectorized substring scan.
+        
+        Args:
+            df: Loaded table
+            lower_cache: Lowercased column cache belonging to df
+            col: Name of the column
+            
+        Returns:
+            pa.Array: Lowercased string values, one per loaded row
+        """
+        values = lower_cache.get(col)
+        if values is None:
+            values = pc.utf8_lower(pa.array(df[col].astype(ARROW_STRING)))
+            lower_cache[col] = values
+        return values
+
+    def _reset_sort(self) -> None:
+        """Returns the table to its natural row order after it is replaced."""
+        self._sort_order = None
+        self.state.last_sort_column = None
+        self.state.sort_ascending = True
+
+    def _sort_column(self, col: str) -> None:
+        """
+        Sorts the table by a column, toggling direction on repeated clicks.
+        
+        A stable sort keeps the previous order among equal keys, so sorting by
+        a second column refines the first instead of scrambling it. The sort
+        is stored as a row order applied when rendering each page.
+        
+        Args:
+            col: Column whose header was clicked
+        """
+        ascending = not (self.state.last_sort_column == col and self.state.sort_ascending)
+        
+        # Only a row order is computed; the table itself is never reordered
+        order = self._sort_order
+        if order is None:
+            order = np.arange(len(self.state.df_table))
+        keys = self.state.df_table[col].take(order).reset_index(drop=True)
+        positions = keys.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+        self._sort_order = order[positions]
+        
+        self.state.last_sort_column = col
+        self.state.sort_ascending = ascending
+        self.state.current_page = 0
+        self._postpone_stats()
         self._render_table()
 
     def _prev_page(self):
-        if self.current_page > 0:
-            self.current_page -= 1
+        if self.state.current_page > 0:
+            self._postpone_stats()
+            self.state.current_page -= 1
             self._render_table()
 
     def _next_page(self):
-        if (self.current_page + 1) * self.page_size < len(self.df_table):
-            self.current_page += 1
+        if self.state.current_page + 1 < self.state.total_pages:
+            self._postpone_stats()
+            self.state.current_page += 1
             self._render_table()
 
     def _export_csv(self):
@@ -762,16 +1292,39 @@ class MRPGUI:
         self.compare_tree = ttk.Treeview(self.tab_compare, show="headings")
         self.compare_tree.pack(fill=tk.BOTH, expand=True)
 
+        status_colors = {
+            "New": "#d4edda",
+            "Removed": "#f8d7da",
+            "Changed": "#fff3cd",
+            "Unchanged": "#f9f9f9"
+        }
+        for status, color in status_colors.items():
+            self.compare_tree.tag_configure(status, background=color)
+
+        nav_frame = ttk.Frame(self.tab_compare)
+        nav_frame.pack(fill=tk.X, pady=10)
+
+        btn_frame = ttk.Frame(nav_frame)
+        btn_frame.pack(side=tk.RIGHT)
+        btn_prev = ttk.Button(btn_frame, text="Previous", command=self._prev_compare_page)
+        btn_prev.pack(side=tk.LEFT, padx=5)
+        ToolTip(btn_prev, text="Previous page")
+        self.compare_page_label = ttk.Label(btn_frame, text="")
+        self.compare_page_label.pack(side=tk.LEFT, padx=5)
+        btn_next = ttk.Button(btn_frame, text="Next", command=self._next_compare_page)
+        btn_next.pack(side=tk.LEFT)
+        ToolTip(btn_next, text="Next page")
+
     def _load_before(self):
         file = filedialog.askopenfilename(filetypes=[("Excel", "*.xlsx")])
         if file:
-            self.compare_before = pd.read_excel(file)
+            self.compare_before = self._use_arrow_strings(read_excel_fast(file))
             self._log(f"Previous analysis loaded: {os.path.basename(file)}", "info")
 
     def _load_after(self):
         file = filedialog.askopenfilename(filetypes=[("Excel", "*.xlsx")])
         if file:
-            self.compare_after = pd.read_excel(file)
+            self.compare_after = self._use_arrow_strings(read_excel_fast(file))
             self._log(f"Current analysis loaded: {os.path.basename(file)}", "info")
 
     def _compare_files(self):
@@ -783,56 +1336,87 @@ class MRPGUI:
             messagebox.showwarning("Empty Analysis", "One or both analyses are empty.")
             self._log("One or both analyses are empty.", "error")
             return
-        before = self.compare_before.set_index("CÓD")
-        after = self.compare_after.set_index("CÓD")
-
-        all_codes = sorted(set(before.index) | set(after.index))
-        result = []
-
-        for code in all_codes:
-            row = {"CÓD": code}
-            row["DESCRIÇÃO"] = after.at[code, "DESCRIÇÃOPROMOB"] if code in after.index else before.at[code, "DESCRIÇÃOPROMOB"]
-            row["FORNECEDOR"] = after.at[code, "FORNECEDOR PRINCIPAL"] if code in after.index else before.at[code, "FORNECEDOR PRINCIPAL"]
-            q_ant = before.at[code, "QUANTIDADE A SOLICITAR"] if code in before.index else 0
-            q_atu = after.at[code, "QUANTIDADE A SOLICITAR"] if code in after.index else 0
-            row["ANTERIOR"] = q_ant
-            row["ATUAL"] = q_atu
-            row["DIFERENÇA"] = q_atu - q_ant
-
-            if code not in before.index:
-                row["STATUS"] = "New"
-            elif code not in after.index:
-                row["STATUS"] = "Removed"
-            elif q_ant != q_atu:
-                row["STATUS"] = "Changed"
-            else:
-                row["STATUS"] = "Unchanged"
-
-            result.append(row)
-
-        df = pd.DataFrame(result)
+        # Align both analyses by code in a single outer merge
+        columns = ["CÓD", "DESCRIÇÃOPROMOB", "FORNECEDOR PRINCIPAL", "QUANTIDADE A SOLICITAR"]
+        merged = self.compare_before[columns].merge(
+            self.compare_after[columns], on="CÓD", how="outer",
+            suffixes=("_ant", "_atu"), indicator=True, sort=True
+        )
+        in_before = (merged["_merge"] != "right_only").to_numpy()
+        in_after = (merged["_merge"] != "left_only").to_numpy()
+
+        q_ant = merged["QUANTIDADE A SOLICITAR_ant"].fillna(0)
+        q_atu = merged["QUANTIDADE A SOLICITAR_atu"].fillna(0)
+        if all(pd.api.types.is_integer_dtype(frame["QUANTIDADE A SOLICITAR"])
+               for frame in (self.compare_before, self.compare_after)):
+            q_ant = q_ant.astype("int64")
+            q_atu = q_atu.astype("int64")
+
+        df = pd.DataFrame({
+            "CÓD": merged["CÓD"],
+            "DESCRIÇÃO": merged["DESCRIÇÃOPROMOB_atu"].where(in_after, merged["DESCRIÇÃOPROMOB_ant"]),
+            "FORNECEDOR": merged["FORNECEDOR PRINCIPAL_atu"].where(in_after, merged["FORNECEDOR PRINCIPAL_ant"]),
+            "ANTERIOR": q_ant,
+            "ATUAL": q_atu,
+            "DIFERENÇA": q_atu - q_ant,
+            "STATUS": np.select(
+                [~in_before, ~in_after, (q_ant != q_atu).to_numpy()],
+                ["New", "Removed", "Changed"],
+                default="Unchanged"
+            )
+        })
+        # Configure columns only when the comparison schema changes
+        columns = tuple(df.columns)
+        if columns != self._last_compare_cols:
+            self.compare_tree["columns"] = columns
+            for col in columns:
+                self.compare_tree.heading(col, text=col, command=lambda c=col: self._sort_compare_column(c))
+            self._last_compare_cols = columns
+
+        # Fit each column to its longest value, measured in one vectorized pass
+        for col in columns:
+            max_len = max(int(df[col].astype(str).str.len().max()), len(col))
+            self.compare_tree.column(col, width=min(200, max(80, max_len * 10)), anchor="center")
+
+        self._compare_df = df
+        self._compare_page = 0
+        self._render_compare_page()
+
+    def _render_compare_page(self) -> None:
+        """
+        Renders the current page of the comparison result.
+        
+        Comparisons can cover thousands of codes and inserting Treeview rows
+        is the expensive part, so only one page is shown at a time.
+        """
         self.compare_tree.delete(*self.compare_tree.get_children())
-        self.compare_tree["columns"] = list(df.columns)
+        df = self._compare_df
+        page_size = self.state.config.page_size
+        total_pages = max((len(df) - 1) // page_size + 1, 1)
+        
+        start_idx = self._compare_page * page_size
+        current_page = df.iloc[start_idx:start_idx + page_size]
+        status_idx = df.columns.get_loc("STATUS")
+        rows = list(current_page.itertuples(index=False, name=None))
+        insert, end = self.compare_tree.insert, tk.END
+        with self._suspend_layout(self.compare_tree):
+            for values in rows:
+                insert("", end, values=values, tags=(values[status_idx],))
+        
+        self.compare_page_label.config(
+            text=f"Page {self._compare_page + 1} of {total_pages}"
+        )
 
-        status_colors = {
-            "New": "#d4edda",
-            "Removed": "#f8d7da",
-            "Changed": "#fff3cd",
-            "Unchanged": "#f9f9f9"
-        }
-        for col in df.columns:
-            self.compare_tree.heading(col, text=col)
-            self.compare_tree.column(col, width=120, anchor="center")
-        for _, row in df.iterrows():
-            tag = row["STATUS"]
-            self.compare_tree.insert("", tk.END, values=list(row), tags=(tag,))
-        for status, color in status_colors.items():
-            self.compare_tree.tag_configure(status, background=color)
-        for col in df.columns:
-            max_len = max([len(str(x)) for x in df[col].values] + [len(col)])
-            self.compare_tree.column(col, width=min(200, max(80, max_len * 10)))
-        for col in df.columns:
-            self.compare_tree.heading(col, text=col, command=lambda c=col: self._sort_compare_column(c))
+    def _prev_compare_page(self):
+        if self._compare_df is not None and self._compare_page > 0:
+            self._compare_page -= 1
+            self._render_compare_page()
+
+    def _next_compare_page(self):
+        if (self._compare_df is not None
+                and (self._compare_page + 1) * self.state.config.page_size < len(self._compare_df)):
+            self._compare_page += 1
+            self._render_compare_page()
             
     def _show_about(self):
         messagebox.showinfo(
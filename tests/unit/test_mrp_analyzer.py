@@ -8,5 +8,74 @@ def test_mrp_analyzer_initialization():
 def test_mrp_config():
     from src.core.mrp_analyzer import MRPConfig
     config = MRPConfig()
-    assert isinstance(config.REQUIRED_COLUMNS, list)
+    assert isinstance(config.REQUIRED_COLUMNS, tuple)
     assert len(config.REQUIRED_COLUMNS) > 0
+    assert config.REQUIRED_COLUMNS_SET == frozenset(config.REQUIRED_COLUMNS)
+
+def test_required_quantity_is_clipped_and_rounded():
+    import numpy as np
+    available = MRPAnalyzer._calculate_available_stock(np.array([10.0, 0.0]), np.array([3.0, 6.0]))
+    quantity = MRPAnalyzer._calculate_required_quantity(
+        np.array([5.0, 10.0]), available, np.array([1.0, 2.0]), np.array([0.0, 1.6])
+    )
+    assert quantity.tolist() == [0, 8]
+
+def test_validate_positive_values_reports_first_negative_column():
+    import pandas as pd
+    from src.core.mrp_analyzer import DataValidator, ValidationError
+    df = pd.DataFrame({"ESTQ10": [1.0, 2.0, 3.0], "ESTQ20": [0.0, -1.0, -2.0]})
+    DataValidator.validate_positive_values(df, ("ESTQ10",))
+    with pytest.raises(ValidationError, match=r"column ESTQ20\. Rows: \[1, 2\]"):
+        DataValidator.validate_positive_values(df, ("ESTQ10", "ESTQ20"))
+
+def test_analyze_keeps_fractional_stock_precision(tmp_path):
+    import pandas as pd
+    input_file = tmp_path / "mrp.xlsx"
+    pd.DataFrame({
+        "CÓD": ["A1", "A2"],
+        "DESCRIÇÃOPROMOB": ["Item 1", "Item 2"],
+        "ESTQ10": [15.0, 0.1],
+        "ESTQ20": [45.0, 0.0],
+        "DEMANDAMRP": [79.6, 10.0],
+        "ESTOQSEG": [23.1, 1.0],
+        "FORNECEDORPRINCIPAL": ["X", "Y"],
+        "PEDIDOS": [5.2, 0.0],
+        "OBS": ["", ""],
+    }).to_excel(input_file, sheet_name="Cálculo MRP", index=False)
+
+    count, error, df = MRPAnalyzer().analyze(
+        str(input_file), "Cálculo MRP", str(tmp_path / "itens_criticos.xlsx")
+    )
+
+    assert error is None and count == 2
+    # 79.6 - 30 + 23.1 - 5.2 is just below 67.5 in double precision
+    assert df["QUANTIDADE A SOLICITAR"].tolist() == [67, 11]
+    assert df["ESTQ10"].tolist() == [15.0, 0.1]
+
+def test_streaming_reader_matches_pandas(tmp_path):
+    import pandas as pd
+    from openpyxl import Workbook
+    from openpyxl.styles import PatternFill
+    from src.core.mrp_analyzer import _read_excel_streaming
+    path = tmp_path / "sheet.xlsx"
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.append(["CÓD", None, "ESTQ10", "ESTQ10"])
+    worksheet.append(["A1", "x", 1, 2])
+    worksheet.append([])
+    worksheet.append(["A2", "y", 3, 4])
+    # Styled but empty cells below and right of the data
+    worksheet["C6"].fill = PatternFill("solid", fgColor="FFFF00")
+    worksheet["F2"].fill = PatternFill("solid", fgColor="FFFF00")
+    workbook.save(path)
+
+    pd.testing.assert_frame_equal(
+        _read_excel_streaming(path), pd.read_excel(path, engine="openpyxl")
+    )
+
+def test_parquet_copy_accepts_mixed_type_columns(tmp_path):
+    import pandas as pd
+    df = pd.DataFrame({"CÓD": pd.Series([1001, "A-2"], dtype=object), "OBS": ["", 42]})
+    parquet_path = MRPAnalyzer()._save_parquet_copy(df, str(tmp_path / "itens_criticos.xlsx"))
+    assert parquet_path is not None
+    assert pd.read_parquet(parquet_path)["CÓD"].tolist() == ["1001", "A-2"]